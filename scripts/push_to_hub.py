@@ -6,14 +6,27 @@ Usage:
   python scripts/push_to_hub.py checkpoints/step_000100 username/my-model
   python scripts/push_to_hub.py checkpoints/step_000100 username/my-model --private
   python scripts/push_to_hub.py checkpoints/step_000100 username/my-model --base-model Qwen/Qwen2.5-7B-Instruct
+  python scripts/push_to_hub.py checkpoints/step_000100 username/my-model --keep-optimizer
 
-Assumes you are logged in via `huggingface-cli login`.
+Assumes you are logged in via `huggingface-cli login`. If `hf_transfer` is
+installed (`pip install hf_transfer`), large files are uploaded with it.
 """
 
 import argparse
+import fnmatch
+import importlib.util
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-from huggingface_hub import HfApi
+# huggingface_hub reads this at import time. Only enable it when the package is
+# present, otherwise huggingface_hub refuses to upload at all.
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+from huggingface_hub import CommitOperationAdd, HfApi  # noqa: E402
+from huggingface_hub.errors import EntryNotFoundError  # noqa: E402
+from huggingface_hub.utils import DEFAULT_IGNORE_PATTERNS  # noqa: E402
 
 
 TOKENIZER_FILES = [
@@ -25,47 +38,142 @@ TOKENIZER_FILES = [
     "added_tokens.json",
 ]
 
+IGNORE_PATTERNS = ["trainer_state.json", "zero_to_fp32.py"]
+
+# Training state (ludic's optimizer.pt, HF Trainer / DeepSpeed shards); only
+# uploaded with --keep-optimizer.
+OPTIMIZER_PATTERNS = [
+    "*.pt",
+    "*.pth",
+    "optimizer.*",
+    "scheduler.*",
+    "rng_state*",
+    "global_step*/*",
+]
+
+# Above this size, single-commit `upload_folder` becomes unreliable on the Hub.
+LARGE_FOLDER_BYTES = 50 * 1024**3
+
+
+def _is_ignored(rel_path: str, ignore_patterns: list[str]) -> bool:
+    return any(fnmatch.fnmatch(rel_path, pattern) for pattern in ignore_patterns)
+
+
+def _files_to_upload(ckpt_path: Path, ignore_patterns: list[str]) -> tuple[list[Path], int]:
+    """Return the files that will be uploaded and their total size in bytes."""
+    # The upload calls always skip .git/ and .cache/huggingface/ (upload
+    # resume metadata) on top of the patterns they are given.
+    patterns = ignore_patterns + DEFAULT_IGNORE_PATTERNS
+    files = [
+        f
+        for f in sorted(ckpt_path.rglob("*"))
+        if f.is_file() and not _is_ignored(f.relative_to(ckpt_path).as_posix(), patterns)
+    ]
+    return files, sum(f.stat().st_size for f in files)
+
+
+def _format_size(num_bytes: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} TB"
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Push checkpoint to HuggingFace Hub")
     parser.add_argument("checkpoint", help="Path to checkpoint directory")
     parser.add_argument("repo_id", help="HuggingFace repo ID (e.g., username/model-name)")
     parser.add_argument("--private", action="store_true", help="Create as private repo")
-    parser.add_argument("--commit-message", default="Upload model", help="Commit message")
+    parser.add_argument(
+        "--commit-message",
+        help="Commit message (default: 'Upload model'; not supported for checkpoints over 50 GB)",
+    )
     parser.add_argument("--base-model", help="Base model to copy tokenizer from (e.g., Qwen/Qwen2.5-7B-Instruct)")
+    parser.add_argument(
+        "--keep-optimizer",
+        action="store_true",
+        help="Also upload optimizer/scheduler/RNG state (e.g. to resume training from the Hub)",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=8,
+        help="Worker threads for tokenizer downloads and large-folder uploads",
+    )
     args = parser.parse_args()
+    if args.max_workers < 1:
+        parser.error("--max-workers must be >= 1")
 
     ckpt_path = Path(args.checkpoint)
     if not ckpt_path.exists():
         raise FileNotFoundError(f"Checkpoint not found: {ckpt_path}")
 
+    # Only count what will actually be uploaded (optimizer state etc. is ignored).
+    ignore_patterns = IGNORE_PATTERNS if args.keep_optimizer else IGNORE_PATTERNS + OPTIMIZER_PATTERNS
+    files, total_bytes = _files_to_upload(ckpt_path, ignore_patterns)
+    if not files:
+        raise FileNotFoundError(f"No files to upload in checkpoint: {ckpt_path}")
+    print(f"Uploading {len(files)} files ({_format_size(total_bytes)}) from {ckpt_path}")
+    use_large_folder = total_bytes > LARGE_FOLDER_BYTES
+    if use_large_folder and args.commit_message is not None:
+        # upload_large_folder generates its own commit messages.
+        parser.error("--commit-message is not supported for checkpoints over 50 GB")
+
     api = HfApi()
     api.create_repo(args.repo_id, private=args.private, exist_ok=True)
 
     # Upload checkpoint
-    api.upload_folder(
-        folder_path=str(ckpt_path),
-        repo_id=args.repo_id,
-        commit_message=args.commit_message,
-        ignore_patterns=["*.pt", "trainer_state.json"],
-    )
+    if use_large_folder:
+        # Batches preuploads and commits in resumable chunks.
+        api.upload_large_folder(
+            repo_id=args.repo_id,
+            folder_path=str(ckpt_path),
+            repo_type="model",
+            ignore_patterns=ignore_patterns,
+            num_workers=args.max_workers,
+        )
+    else:
+        api.upload_folder(
+            folder_path=str(ckpt_path),
+            repo_id=args.repo_id,
+            commit_message=args.commit_message or "Upload model",
+            ignore_patterns=ignore_patterns,
+        )
     print(f"Pushed checkpoint to https://huggingface.co/{args.repo_id}")
 
     # Copy tokenizer from base model if specified
     if args.base_model:
         print(f"Copying tokenizer from {args.base_model}...")
-        for filename in TOKENIZER_FILES:
+
+        def _download(filename: str) -> tuple[str, str | None]:
             try:
-                local_path = api.hf_hub_download(args.base_model, filename)
-                api.upload_file(
-                    path_or_fileobj=local_path,
-                    path_in_repo=filename,
-                    repo_id=args.repo_id,
-                    commit_message=f"Add {filename} from {args.base_model}",
-                )
-                print(f"  Copied {filename}")
-            except Exception:
-                pass  # File doesn't exist in base model, skip
+                return filename, api.hf_hub_download(args.base_model, filename)
+            except EntryNotFoundError:
+                return filename, None  # File doesn't exist in base model, skip
+
+        # Downloads are independent Hub round trips, so overlap them, then
+        # add every file in a single commit.
+        downloaded: dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=min(args.max_workers, len(TOKENIZER_FILES))) as pool:
+            futures = [pool.submit(_download, filename) for filename in TOKENIZER_FILES]
+            for future in as_completed(futures):
+                filename, local_path = future.result()
+                if local_path is not None:
+                    downloaded[filename] = local_path
+
+        copied = [filename for filename in TOKENIZER_FILES if filename in downloaded]
+        if copied:
+            api.create_commit(
+                repo_id=args.repo_id,
+                operations=[
+                    CommitOperationAdd(path_in_repo=filename, path_or_fileobj=downloaded[filename])
+                    for filename in copied
+                ],
+                commit_message=f"Add tokenizer from {args.base_model}",
+            )
+        for filename in copied:
+            print(f"  Copied {filename}")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,9 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
-from ludic.types import Message, Observation, Info, ChatResponse
+from typing import List, Optional, Dict, Any, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ludic.types import Message, Observation, Info, ChatResponse
 
 class ContextStrategy(ABC):
     """
@@ -9,6 +11,8 @@ class ContextStrategy(ABC):
     Natively supports System, User, Assistant, and Tool messages.
     """
 
+    __slots__ = ("_messages", "_default_system_prompt")
+
     def __init__(self, system_prompt: Optional[str] = None) -> None:
         """
         Initializes the context, optionally with a default system prompt.
@@ -100,8 +104,19 @@ class ContextStrategy(ABC):
     # ---- convenience ----------------------------------------------------
     @property
     def messages(self) -> List[Message]:
+        """A copy of the transcript; safe to mutate or keep."""
         return list(self._messages)
 
+    @property
+    def messages_view(self) -> Sequence[Message]:
+        """
+        The live transcript, without copying.
+
+        Read-only by contract: do not mutate it, and copy it if you need
+        a snapshot that outlives the next hook call.
+        """
+        return self._messages
+
     @property
     def default_system_prompt(self) -> Optional[str]:
         return self._default_system_prompt
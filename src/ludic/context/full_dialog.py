@@ -5,6 +5,8 @@ from ludic.inference.client import ChatResponse
 from ludic.types import Message, Observation, Info
 
 class FullDialog(ContextStrategy):
+    __slots__ = ()
+
     def on_env_reset(self, obs: Observation, info: Info) -> None:
         self._messages.append({"role": "user", "content": obs})
 
@@ -1,10 +1,54 @@
 from __future__ import annotations
-import re
-from typing import List, Pattern
+from typing import List, Optional, Sequence, Tuple
 
 from ludic.context.full_dialog import FullDialog
 from ludic.types import Message
 
+
+def _split_think_prefix(content: str) -> Optional[Tuple[str, str, str]]:
+    r"""
+    Split a strict `<think>...</think> ANSWER` message into its kept parts.
+
+    Returns (opening, closing, answer), where `opening` is the leading
+    whitespace plus the `<think>` tag and `closing` is the first `</think>`
+    tag plus the whitespace after it, or None if the message does not
+    follow the strict format. Tags match case-insensitively and the answer
+    must be non-empty.
+
+    This is a linear scan with str.find; it replaces the equivalent regex
+    ^(\s*<think>)(.*?)(</think>\s*)(.+)$ (DOTALL | IGNORECASE), whose lazy
+    body backtracked over the whole thought on every call.
+    """
+    body_start = len(content) - len(content.lstrip()) + 7
+    if content[body_start - 7 : body_start].lower() != "<think>":
+        return None
+
+    # First closing tag (the regex body is non-greedy). Searching the
+    # lowercased text keeps this in C; indices line up unless lowering
+    # changed the length (rare non-ASCII cases), then scan candidates.
+    lowered = content.lower()
+    if len(lowered) == len(content):
+        close = lowered.find("</think>", body_start)
+    else:
+        close = content.find("</", body_start)
+        while close != -1 and content[close + 2 : close + 8].lower() != "think>":
+            close = content.find("</", close + 2)
+    if close == -1:
+        return None
+
+    n = len(content)
+    answer_start = close + 8
+    if answer_start >= n:
+        # Nothing after </think>: thoughts only, keep it visible.
+        return None
+
+    # Trailing whitespace belongs to the closing part, but the answer keeps
+    # at least one character (the regex's \s* backtracks for `.+`).
+    while answer_start < n - 1 and content[answer_start].isspace():
+        answer_start += 1
+    return content[:body_start], content[close:answer_start], content[answer_start:]
+
+
 class TruncatedThinkingContext(FullDialog):
     """
     A context strategy that preserves full history in memory, but
@@ -17,6 +61,14 @@ class TruncatedThinkingContext(FullDialog):
     it is left untouched so the model (and you) can see the full state.
     """
 
+    __slots__ = (
+        "placeholder",
+        "_sanitized",
+        "_sanitized_upto",
+        "_sanitized_src",
+        "_sanitized_placeholder",
+    )
+
     def __init__(
         self, 
         system_prompt: str | None = None,
@@ -24,47 +76,62 @@ class TruncatedThinkingContext(FullDialog):
     ) -> None:
         super().__init__(system_prompt=system_prompt)
         self.placeholder = placeholder
-        
-        # STRICT PATTERN EXPLANATION:
-        # ^\s* -> Start of string (ignoring leading whitespace)
-        # (<think>)     -> Capture Group 1: Opening tag
-        # (.*?)         -> Capture Group 2: The thought content (non-greedy)
-        # (</think>)    -> Capture Group 3: Closing tag
-        # \s* -> Optional whitespace between tag and answer
-        # (.+)          -> Capture Group 4: THE ANSWER (Must be present and non-empty!)
-        # $             -> End of string
-        self.strict_pattern: Pattern = re.compile(
-            r"^(\s*<think>)(.*?)(</think>\s*)(.+)$", 
-            flags=re.DOTALL | re.IGNORECASE
-        )
+        # The transcript is append-only between resets, so a message's
+        # sanitized form never changes: keep the sanitized prefix and only
+        # process messages appended since the last call. While no message
+        # has been rewritten, the prefix is just the raw history and is not
+        # materialized (None).
+        self._sanitized: Optional[List[Message]] = None
+        self._sanitized_upto: int = 0
+        self._sanitized_src: Optional[Sequence[Message]] = None
+        self._sanitized_placeholder: str = placeholder
+
+    def reset(self, *, system_prompt: Optional[str] = None) -> None:
+        super().reset(system_prompt=system_prompt)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._sanitized = None
+        self._sanitized_upto = 0
+        self._sanitized_src = self.messages_view
+        self._sanitized_placeholder = self.placeholder
+
+    def _sanitize(self, msg: Message) -> Message:
+        if msg.get("role") != "assistant":
+            return msg
+
+        # If the format isn't exactly right (e.g. missing answer, broken
+        # tags), parts is None and the raw content is kept.
+        parts = _split_think_prefix(msg.get("content", ""))
+        if parts is None:
+            return msg
+
+        # Reconstruct: <think> + placeholder + </think> + answer
+        opening, closing, answer = parts
+        new_msg = dict(msg)
+        new_msg["content"] = f"{opening}{self.placeholder}{closing}{answer}"
+        return new_msg
 
     def on_before_act(self) -> List[Message]:
-        raw_history = super().on_before_act()
-        sanitized_history: List[Message] = []
-
-        for msg in raw_history:
-            if msg.get("role") == "assistant":
-                content = msg.get("content", "")
-                
-                # We attempt to match the STRICT pattern.
-                # If the regex doesn't match (e.g. missing answer, broken tags),
-                # m will be None and we skip the truncation block.
-                m = self.strict_pattern.match(content)
-                
-                if m:
-                    # Reconstruct: <think> + placeholder + </think> + answer
-                    # Group 1: "<think>" (with potential leading whitespace)
-                    # Group 3: "</think>" (with potential trailing whitespace)
-                    # Group 4: The Answer
-                    new_content = f"{m.group(1)}{self.placeholder}{m.group(3)}{m.group(4)}"
-                    
-                    new_msg = dict(msg)
-                    new_msg["content"] = new_content
-                    sanitized_history.append(new_msg)
-                else:
-                    # Format wasn't exactly right -> Keep raw content
-                    sanitized_history.append(msg)
-            else:
-                sanitized_history.append(msg)
-
-        return sanitized_history
\ No newline at end of file
+        history = self.messages_view
+        if (
+            history is not self._sanitized_src
+            or len(history) < self._sanitized_upto
+            or self.placeholder != self._sanitized_placeholder
+        ):
+            self._invalidate()
+
+        sanitized = self._sanitized
+        for i in range(self._sanitized_upto, len(history)):
+            msg = history[i]
+            new_msg = self._sanitize(msg)
+            if sanitized is None:
+                if new_msg is msg:
+                    continue
+                # First rewrite: everything before it is untouched.
+                sanitized = self._sanitized = list(history[:i])
+            sanitized.append(new_msg)
+        self._sanitized_upto = len(history)
+
+        # Callers keep the returned list as the step's prompt, so hand out a copy.
+        return list(history if sanitized is None else sanitized)
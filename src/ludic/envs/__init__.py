@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from .dataset_qa_env import DatasetQAEnv, ParserFn, PromptBuilder, Sample, VerifierFn
+from .dataset_qa_env import BatchDatasetQAEnv, DatasetQAEnv, ParserFn, PromptBuilder, Sample, VerifierFn
 from .env import LudicEnv
 from .single_agent_env import SingleAgentEnv
 
@@ -8,6 +8,7 @@ __all__ = [
     "LudicEnv",
     "SingleAgentEnv",
     "DatasetQAEnv",
+    "BatchDatasetQAEnv",
     "Sample",
     "ParserFn",
     "VerifierFn",
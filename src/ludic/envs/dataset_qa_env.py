@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Mapping, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
+from ludic.envs.env import LudicEnv
 from ludic.envs.single_agent_env import SingleAgentEnv
-from ludic.types import Info, Observation, StepOutcome
+from ludic.types import StepOutcome
+
+if TYPE_CHECKING:
+    from ludic.types import Info, Observation
 
 
 Sample = Mapping[str, Any]
@@ -21,6 +25,53 @@ def _default_verifier(a: str, b: str) -> bool:
     return a.strip().lower() == b.strip().lower()
 
 
+def _prompt_from_sample(
+    sample: Sample, prompt_key: str, prompt_builder: Optional[PromptBuilder]
+) -> Observation:
+    if prompt_builder is not None:
+        return prompt_builder(sample)
+
+    if prompt_key not in sample:
+        raise KeyError(f"Sample missing prompt_key {prompt_key!r}: {sample}")
+
+    return str(sample[prompt_key])
+
+
+def _answer_from_sample(sample: Sample, answer_key: str) -> str:
+    if answer_key not in sample:
+        raise KeyError(f"Sample missing answer_key {answer_key!r}: {sample}")
+    return str(sample[answer_key])
+
+
+def _id_from_sample(sample: Sample) -> str:
+    return str(sample.get("id") or sample.get("uid") or 0)
+
+
+def _grade_outcome(
+    *,
+    question_id: str,
+    action: str,
+    parsed_target: str,
+    correct: bool,
+    correct_reward: float,
+    incorrect_reward: float,
+) -> StepOutcome:
+    obs = "✅ Correct." if correct else f"❌ Incorrect. Expected {parsed_target}."
+    return StepOutcome(
+        obs=obs,
+        reward=correct_reward if correct else incorrect_reward,
+        truncated=False,
+        terminated=True,
+        info={
+            "question_id": question_id,
+            "raw_action": action,
+            "parsed_answer": action,
+            "target_answer": parsed_target,
+            "correct": correct,
+        },
+    )
+
+
 class DatasetQAEnv(SingleAgentEnv):
     """
     A one-shot QA environment for a single sample.
@@ -38,6 +89,26 @@ class DatasetQAEnv(SingleAgentEnv):
     (e.g. `ludic.parsers.boxed_parser`).
     """
 
+    __slots__ = (
+        "_sample",
+        "_prompt_key",
+        "_answer_key",
+        "_system_prompt",
+        "_prompt_builder",
+        "_target_parser",
+        "_verifier",
+        "_correct_reward",
+        "_incorrect_reward",
+        "_current_prompt",
+        "_current_answer",
+        "_parsed_target",
+        "_normalized_target",
+        "_current_id",
+        "_done",
+        "_latest_obs",
+        "_reset_cache",
+    )
+
     def __init__(
         self,
         sample: Sample,
@@ -63,9 +134,14 @@ class DatasetQAEnv(SingleAgentEnv):
         self._incorrect_reward = incorrect_reward
         self._current_prompt: Observation = ""
         self._current_answer: str = ""
-        self._current_id: Optional[str] = None
+        self._parsed_target: str = ""
+        self._normalized_target: Optional[str] = None
+        self._current_id: str = ""
         self._done: bool = False
         self._latest_obs: Observation = ""
+        # The sample is fixed for the env's lifetime, so everything derived
+        # from it is computed on the first reset() and reused afterwards.
+        self._reset_cache: Optional[Tuple[Observation, str, str, Optional[str], str]] = None
 
     # ------------------------------------------------------------------
     # SingleAgentEnv implementation
@@ -76,66 +152,234 @@ class DatasetQAEnv(SingleAgentEnv):
         return self._system_prompt
 
     def _build_prompt(self, sample: Sample) -> Observation:
-        if self._prompt_builder is not None:
-            return self._prompt_builder(sample)
-
-        if self._prompt_key not in sample:
-            raise KeyError(f"Sample missing prompt_key {self._prompt_key!r}: {sample}")
-
-        return str(sample[self._prompt_key])
+        return _prompt_from_sample(sample, self._prompt_key, self._prompt_builder)
 
     def _get_answer(self, sample: Sample) -> str:
-        if self._answer_key not in sample:
-            raise KeyError(f"Sample missing answer_key {self._answer_key!r}: {sample}")
-        return str(sample[self._answer_key])
+        return _answer_from_sample(sample, self._answer_key)
 
     def env_reset(self, *, seed: Optional[int] = None) -> Tuple[Observation, Info]:
-        prompt = self._build_prompt(self._sample)
-        answer = self._get_answer(self._sample)
+        if self._reset_cache is None:
+            prompt = self._build_prompt(self._sample)
+            answer = self._get_answer(self._sample)
+            parsed_target = self._target_parser(answer)
+            # With the default verifier, only the action side varies per step.
+            normalized_target = (
+                parsed_target.strip().lower()
+                if self._verifier is _default_verifier
+                else None
+            )
+            question_id = _id_from_sample(self._sample)
+            self._reset_cache = (prompt, answer, parsed_target, normalized_target, question_id)
 
-        self._current_prompt = prompt
-        self._current_answer = answer
-        self._current_id = str(self._sample.get("id") or self._sample.get("uid") or 0)
+        (
+            self._current_prompt,
+            self._current_answer,
+            self._parsed_target,
+            self._normalized_target,
+            self._current_id,
+        ) = self._reset_cache
         self._done = False
-        self._latest_obs = prompt
+        self._latest_obs = self._current_prompt
 
         info: Info = {
             "question_id": self._current_id,
         }
-        return prompt, info
+        return self._current_prompt, info
 
     def env_step(self, action: str) -> StepOutcome:
         if self._done:
             raise RuntimeError("env_step called after episode finished. Call reset().")
 
-        info: Info = {
-            "question_id": self._current_id,
-            "raw_action": action,
-        }
-
-        parsed_target = self._target_parser(self._current_answer)
-        correct = self._verifier(action, parsed_target)
+        if self._normalized_target is not None:
+            # Inlined _default_verifier against the pre-normalized target.
+            correct = action.strip().lower() == self._normalized_target
+        else:
+            correct = self._verifier(action, self._parsed_target)
         self._done = True
 
-        info.update(
-            {
-                "parsed_answer": action,
-                "target_answer": parsed_target,
-                "correct": correct,
-            }
-        )
-
-        obs = "✅ Correct." if correct else f"❌ Incorrect. Expected {parsed_target}."
-        reward = self._correct_reward if correct else self._incorrect_reward
-        self._latest_obs = obs
-
-        return StepOutcome(
-            obs=obs,
-            reward=reward,
-            truncated=False,
-            terminated=True,
-            info=info,
+        outcome = _grade_outcome(
+            question_id=self._current_id,
+            action=action,
+            parsed_target=self._parsed_target,
+            correct=correct,
+            correct_reward=self._correct_reward,
+            incorrect_reward=self._incorrect_reward,
         )
+        self._latest_obs = outcome.obs
+        return outcome
 
     def env_current_obs(self) -> Observation:
         return self._latest_obs
+
+
+class BatchDatasetQAEnv(LudicEnv[str, str, str]):
+    """
+    A one-shot QA environment over a batch of samples.
+
+    Equivalent to N `DatasetQAEnv`s with the same options, but held as one
+    object: prompts and targets are stored as parallel lists and a step
+    grades every submitted answer in a single loop. Each sample gets its
+    own agent slot (`agent_0` ... `agent_{N-1}`), so the env plugs into
+    `MultiAgentProtocol` via `reset()`/`step()`.
+
+    `env_reset()`/`env_step()` are the list-based equivalents for callers
+    that grade answers directly (e.g. eval loops): results are aligned with
+    `samples`, and a `None` action means "this sample did not answer".
+    """
+
+    __slots__ = (
+        "_samples",
+        "_prompt_key",
+        "_answer_key",
+        "_system_prompt",
+        "_prompt_builder",
+        "_target_parser",
+        "_verifier",
+        "_correct_reward",
+        "_incorrect_reward",
+        "_agent_ids",
+        "_index",
+        "_done",
+        "_latest_obs",
+        "_prompts",
+        "_parsed_targets",
+        "_normalized_targets",
+        "_question_ids",
+    )
+
+    def __init__(
+        self,
+        samples: Sequence[Sample],
+        *,
+        prompt_key: str = "question",
+        answer_key: str = "answer",
+        system_prompt: Optional[str] = None,
+        prompt_builder: Optional[PromptBuilder] = None,
+        target_parser: ParserFn = _identity_parser,
+        verifier: VerifierFn = _default_verifier,
+        correct_reward: float = 1.0,
+        incorrect_reward: float = 0.0,
+    ) -> None:
+        if not samples:
+            raise ValueError("BatchDatasetQAEnv requires at least one sample.")
+        self._samples: List[Sample] = list(samples)
+        self._prompt_key = prompt_key
+        self._answer_key = answer_key
+        self._system_prompt = system_prompt
+        self._prompt_builder = prompt_builder
+        self._target_parser = target_parser
+        self._verifier = verifier
+        self._correct_reward = correct_reward
+        self._incorrect_reward = incorrect_reward
+
+        n = len(self._samples)
+        self._agent_ids: List[str] = [f"agent_{i}" for i in range(n)]
+        self._index: Dict[str, int] = {aid: i for i, aid in enumerate(self._agent_ids)}
+        self._done: List[bool] = [True] * n
+        self._latest_obs: List[Observation] = [""] * n
+
+        # Derived from the samples on the first reset(), like DatasetQAEnv.
+        self._prompts: Optional[List[Observation]] = None
+        self._parsed_targets: List[str] = []
+        self._normalized_targets: Optional[List[str]] = None
+        self._question_ids: List[str] = []
+
+    @property
+    def suggested_sysprompt(self) -> Optional[str]:
+        return self._system_prompt
+
+    def _prepare(self) -> List[Observation]:
+        prompts = [
+            _prompt_from_sample(s, self._prompt_key, self._prompt_builder)
+            for s in self._samples
+        ]
+        parse = self._target_parser
+        answer_key = self._answer_key
+        self._parsed_targets = [parse(_answer_from_sample(s, answer_key)) for s in self._samples]
+        if self._verifier is _default_verifier:
+            self._normalized_targets = [t.strip().lower() for t in self._parsed_targets]
+        self._question_ids = [_id_from_sample(s) for s in self._samples]
+        self._prompts = prompts
+        return prompts
+
+    # ------------------------------------------------------------------
+    # Batched API
+    # ------------------------------------------------------------------
+
+    def env_reset(self, *, seed: Optional[int] = None) -> Tuple[List[Observation], List[Info]]:
+        prompts = self._prompts if self._prompts is not None else self._prepare()
+        n = len(prompts)
+        self._done = [False] * n
+        self._latest_obs = list(prompts)
+        return list(prompts), [{"question_id": qid} for qid in self._question_ids]
+
+    def env_step(self, actions: Sequence[Optional[str]]) -> List[Optional[StepOutcome]]:
+        if len(actions) != len(self._samples):
+            raise ValueError(
+                f"Expected {len(self._samples)} actions (one per sample), got {len(actions)}."
+            )
+
+        done = self._done
+        targets = self._parsed_targets
+        normalized = self._normalized_targets
+        verifier = self._verifier
+        # Validate the whole batch first so a rejected step leaves no sample graded.
+        for i, action in enumerate(actions):
+            if action is not None and done[i]:
+                raise RuntimeError(
+                    f"env_step called after episode finished for sample {i}. Call reset()."
+                )
+
+        outcomes: List[Optional[StepOutcome]] = []
+        for i, action in enumerate(actions):
+            if action is None:
+                outcomes.append(None)
+                continue
+            if normalized is not None:
+                correct = action.strip().lower() == normalized[i]
+            else:
+                correct = verifier(action, targets[i])
+            done[i] = True
+
+            outcome = _grade_outcome(
+                question_id=self._question_ids[i],
+                action=action,
+                parsed_target=targets[i],
+                correct=correct,
+                correct_reward=self._correct_reward,
+                incorrect_reward=self._incorrect_reward,
+            )
+            self._latest_obs[i] = outcome.obs
+            outcomes.append(outcome)
+        return outcomes
+
+    # ------------------------------------------------------------------
+    # LudicEnv implementation
+    # ------------------------------------------------------------------
+
+    @property
+    def agent_ids(self) -> List[str]:
+        return list(self._agent_ids)
+
+    @property
+    def active_agents(self) -> List[str]:
+        return [aid for aid, done in zip(self._agent_ids, self._done) if not done]
+
+    def reset(self, *, seed: Optional[int] = None) -> Dict[str, Tuple[str, Info]]:
+        prompts, infos = self.env_reset(seed=seed)
+        return {aid: (obs, info) for aid, obs, info in zip(self._agent_ids, prompts, infos)}
+
+    def step(self, actions: Dict[str, str]) -> Dict[str, StepOutcome]:
+        unknown = set(actions) - self._index.keys()
+        if unknown:
+            raise KeyError(f"Unknown agent ids: {sorted(unknown)}")
+        aligned: List[Optional[str]] = [actions.get(aid) for aid in self._agent_ids]
+        outcomes = self.env_step(aligned)
+        return {
+            aid: outcome
+            for aid, outcome in zip(self._agent_ids, outcomes)
+            if outcome is not None
+        }
+
+    def current_obs(self) -> Dict[str, str]:
+        return dict(zip(self._agent_ids, self._latest_obs))
@@ -1,9 +1,11 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import (
-    Generic, TypeVar, List, Dict, Tuple, Optional
+    Generic, TypeVar, List, Dict, Tuple, Optional, TYPE_CHECKING
 )
-from ludic.types import StepOutcome, Info
+
+if TYPE_CHECKING:
+    from ludic.types import StepOutcome, Info
 
 # --- Generic Types for the Kernel Interface ---
 
@@ -23,6 +25,8 @@ class LudicEnv(ABC, Generic[AgentID, ObsType, ActionType]):
     be built to consume. It is multi-agent by default.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def agent_ids(self) -> List[AgentID]:
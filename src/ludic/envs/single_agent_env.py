@@ -13,6 +13,8 @@ class SingleAgentEnv(LudicEnv[str, str, str]):
     exposing a simple API for you to implement.
     """
     
+    __slots__ = ("_agent_id",)
+
     _DEFAULT_ID = "agent_0"
 
     def __init__(self, agent_id: str = _DEFAULT_ID) -> None:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable, Optional
 
 
@@ -9,7 +10,7 @@ from typing import Callable, Optional
 # ParseResult and semantic parser API
 # ---------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseResult:
     """
     Result of a semantic parser.
@@ -34,24 +35,22 @@ def compose_parsers(*parsers: Parser) -> Parser:
     accumulated reward.
     """
     def _p(raw: str) -> ParseResult:
-        current = ParseResult(action=raw, reward=0.0, obs=None)
+        action = raw
+        reward = 0.0
 
         for parser in parsers:
-            result = parser(current.action)  # type: ignore[arg-type]
+            result = parser(action)
             if result.action is None:
                 return ParseResult(
                     action=None,
-                    reward=current.reward + result.reward,
+                    reward=reward + result.reward,
                     obs=result.obs,
                 )
             # success: accumulate reward
-            current = ParseResult(
-                action=result.action,
-                reward=current.reward + result.reward,
-                obs=None,
-            )
+            action = result.action
+            reward += result.reward
 
-        return current
+        return ParseResult(action=action, reward=reward, obs=None)
     return _p
 
 
@@ -59,28 +58,20 @@ def compose_parsers(*parsers: Parser) -> Parser:
 # XML parser factory
 # ---------------------------------------------------------------------
 
-def xml_parser(
-    tag: str,
-    *,
-    exact: bool = False,
-    kind: str = "inner",
-    success_reward: float = 0.1,
-    error_reward: float = -1.0,
-) -> Parser:
+@lru_cache(maxsize=None)
+def _compile_xml(tag: str, exact: bool, kind: str) -> tuple[re.Pattern[str], str]:
     """
-    Create a Parser based on an XML-ish tag contract.
+    Build (pattern, expectation message) for an xml_parser contract.
 
-    Args:
-        tag: Tag name (e.g. "move" for <move>...</move>).
-        exact: If True, require the entire output to be exactly one tag
-            (aside from surrounding whitespace). If False, succeed if the tag
-            appears anywhere in the text.
-        kind:
-            - "inner": return the inner text inside <tag>...</tag>
-            - "remainder_after_prefix": require the output start with <tag>...</tag>
-              and return the remainder after the closing tag (must be non-empty).
+    Cached so that repeated factory calls (e.g. think_prefix_parser, which
+    builds its parser per call) share one compiled pattern.
     """
     tag_re = re.escape(tag)
+    # Tag body up to the first closing tag, equivalent to a lazy `.*?` but
+    # without retrying the close tag at every position: runs of non-"<"
+    # are consumed in one step and only a "<" starts a check. Possessive,
+    # since giving characters back can never expose a closing tag.
+    body = rf"[^<]*+(?:<(?!/{tag_re}>)[^<]*+)*+"
 
     if kind == "inner":
         if exact:
@@ -91,64 +82,112 @@ def xml_parser(
             expectation = f"Expected output to be exactly <{tag}>...</{tag}> (and nothing else)."
         else:
             pattern = re.compile(
-                rf"<{tag_re}>(.*?)</{tag_re}>",
+                rf"<{tag_re}>({body})</{tag_re}>",
                 flags=re.DOTALL | re.IGNORECASE,
             )
             expectation = f"Expected <{tag}>...</{tag}>."
-
-        def _p(raw: str) -> ParseResult:
-            try:
-                m = pattern.search(raw)
-                if not m:
-                    raise ValueError(expectation)
-
-                inner = m.group(1).strip()
-                if not inner:
-                    raise ValueError(f"Empty <{tag}> tag.")
-
-                return ParseResult(action=inner, reward=success_reward, obs=None)
-
-            except Exception as e:
-                return ParseResult(
-                    action=None,
-                    reward=error_reward,
-                    obs=f"Invalid action format: {e}",
-                )
-
-        return _p
+        return pattern, expectation
 
     if kind == "remainder_after_prefix":
         if exact:
             raise ValueError("exact=True is not supported for kind='remainder_after_prefix'")
 
         pattern = re.compile(
-            rf"^\s*<{tag_re}>(.*?)</{tag_re}>\s*(.+)$",
+            rf"^\s*<{tag_re}>({body})</{tag_re}>\s*(.+)$",
             flags=re.DOTALL | re.IGNORECASE,
         )
         expectation = f"Expected '<{tag}>...</{tag}>' prefix followed by content."
+        return pattern, expectation
 
-        def _p(raw: str) -> ParseResult:
-            try:
-                m = pattern.match(raw)
-                if not m:
-                    raise ValueError(expectation)
+    raise ValueError(f"Unknown kind={kind!r}")
 
-                remainder = m.group(2).strip()
-                if not remainder:
-                    raise ValueError(f"Missing content after </{tag}>.")
 
-                return ParseResult(action=remainder, reward=success_reward, obs=None)
+def _build_inner_parser(
+    tag: str,
+    pattern: re.Pattern[str],
+    expectation: str,
+    success_reward: float,
+    error_reward: float,
+) -> Parser:
+    search = pattern.search
+    missing_obs = f"Invalid action format: {expectation}"
+    empty_obs = f"Invalid action format: Empty <{tag}> tag."
 
-            except Exception as e:
-                return ParseResult(
-                    action=None,
-                    reward=error_reward,
-                    obs=f"Invalid action format: {e}",
-                )
+    def _p(raw: str) -> ParseResult:
+        # Outputs with no tag at all are common; "<" is a memchr
+        # scan, much cheaper than the case-insensitive search.
+        m = search(raw) if "<" in raw else None
+        if not m:
+            return ParseResult(action=None, reward=error_reward, obs=missing_obs)
+
+        inner = m.group(1).strip()
+        if not inner:
+            return ParseResult(action=None, reward=error_reward, obs=empty_obs)
 
-        return _p
+        return ParseResult(action=inner, reward=success_reward, obs=None)
+
+    return _p
+
+
+def _build_remainder_parser(
+    tag: str,
+    pattern: re.Pattern[str],
+    expectation: str,
+    success_reward: float,
+    error_reward: float,
+) -> Parser:
+    match = pattern.match
+    missing_obs = f"Invalid action format: {expectation}"
+    missing_remainder_obs = f"Invalid action format: Missing content after </{tag}>."
+
+    def _p(raw: str) -> ParseResult:
+        m = match(raw)
+        if not m:
+            return ParseResult(action=None, reward=error_reward, obs=missing_obs)
+
+        remainder = m.group(2).strip()
+        if not remainder:
+            return ParseResult(action=None, reward=error_reward, obs=missing_remainder_obs)
+
+        return ParseResult(action=remainder, reward=success_reward, obs=None)
+
+    return _p
 
-    raise ValueError(f"Unknown kind={kind!r}")
+
+# xml_parser kind -> closure builder, called with the kind's compiled pattern.
+_XML_KIND_BUILDERS: dict[str, Callable[[str, re.Pattern[str], str, float, float], Parser]] = {
+    "inner": _build_inner_parser,
+    "remainder_after_prefix": _build_remainder_parser,
+}
+
+
+def xml_parser(
+    tag: str,
+    *,
+    exact: bool = False,
+    kind: str = "inner",
+    success_reward: float = 0.1,
+    error_reward: float = -1.0,
+) -> Parser:
+    """
+    Create a Parser based on an XML-ish tag contract.
+
+    Args:
+        tag: Tag name (e.g. "move" for <move>...</move>).
+        exact: If True, require the entire output to be exactly one tag
+            (aside from surrounding whitespace). If False, succeed if the tag
+            appears anywhere in the text.
+        kind:
+            - "inner": return the inner text inside <tag>...</tag>
+            - "remainder_after_prefix": require the output start with <tag>...</tag>
+              and return the remainder after the closing tag (must be non-empty).
+    """
+    build = _XML_KIND_BUILDERS.get(kind)
+    if build is None:
+        raise ValueError(f"Unknown kind={kind!r}")
+
+    pattern, expectation = _compile_xml(tag, exact, kind)
+    return build(tag, pattern, expectation, success_reward, error_reward)
 
 
 def xml_tag_parser(
@@ -175,6 +214,16 @@ def xml_tag_parser(
     )
 
 
+@lru_cache(maxsize=32)
+def _think_prefix(success_reward: float, error_reward: float) -> Parser:
+    return xml_parser(
+        "think",
+        kind="remainder_after_prefix",
+        success_reward=success_reward,
+        error_reward=error_reward,
+    )
+
+
 def think_prefix_parser(
     raw: str,
     *,
@@ -190,12 +239,8 @@ def think_prefix_parser(
     Output:
         action = ANSWER
     """
-    return xml_parser(
-        "think",
-        kind="remainder_after_prefix",
-        success_reward=success_reward,
-        error_reward=error_reward,
-    )(raw)
+    # The parser for each reward pair is built once and reused across calls.
+    return _think_prefix(success_reward, error_reward)(raw)
 
 
 # Backwards-friendly alias for readability in older examples/tests.
@@ -206,6 +251,9 @@ cot_prefix_parser = think_prefix_parser
 # Strict \boxed{...} answer parser
 # ---------------------------------------------------------------------
 
+_BRACE_RE = re.compile(r"[{}]")
+
+
 def extract_last_boxed_content(raw: str) -> Optional[str]:
     """
     Extract the content of the last LaTeX \\boxed{...} occurrence.
@@ -213,34 +261,31 @@ def extract_last_boxed_content(raw: str) -> Optional[str]:
     Supports nested braces inside the boxed content (e.g. \\boxed{\\frac{1}{2}}).
     Returns None if no well-formed \\boxed{...} is found.
     """
-    matches = list(re.finditer(r"\\boxed\s*\{", raw))
-    if not matches:
-        return None
-
-    def _parse_braced(start_brace_idx: int) -> Optional[str]:
-        if start_brace_idx >= len(raw) or raw[start_brace_idx] != "{":
-            return None
-
-        depth = 0
-        i = start_brace_idx
-        while i < len(raw):
-            ch = raw[i]
-            prev = raw[i - 1] if i > 0 else ""
-
-            if ch == "{" and prev != "\\":
-                depth += 1
-            elif ch == "}" and prev != "\\":
-                depth -= 1
-                if depth == 0:
-                    return raw[start_brace_idx + 1 : i]
-            i += 1
-        return None
-
-    # Prefer the last occurrence (the model may include intermediate boxes).
-    for m in reversed(matches):
-        inner = _parse_braced(m.end() - 1)
-        if inner is not None:
-            return inner
+    # Prefer the last occurrence (the model may include intermediate boxes),
+    # so walk candidates backwards and stop at the first well-formed one.
+    n = len(raw)
+    key = raw.rfind("\\boxed")
+    while key != -1:
+        brace = key + 6
+        while brace < n and raw[brace].isspace():
+            brace += 1
+
+        if brace < n and raw[brace] == "{":
+            # Only braces move the depth, so visit just those; a brace right
+            # after a backslash is escaped and does not count.
+            depth = 0
+            for m in _BRACE_RE.finditer(raw, brace):
+                i = m.start()
+                if raw[i - 1] == "\\":
+                    continue
+                if raw[i] == "{":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        return raw[brace + 1 : i]
+
+        key = raw.rfind("\\boxed", 0, key)
     return None
 
 
@@ -257,21 +302,21 @@ def boxed_parser(
         Defaults to +0.1 on success and -1.0 on failure; override via keyword
         args or functools.partial for custom parser instances.
     """
-    try:
-        inner = extract_last_boxed_content(raw)
-        if inner is None:
-            raise ValueError("Expected \\boxed{...} with the final answer.")
-
-        inner = inner.strip()
-        if not inner:
-            raise ValueError("Empty \\boxed{} content.")
-
-        # Positive intrinsic reward for good formatting
-        return ParseResult(action=inner, reward=success_reward, obs=None)
+    inner = extract_last_boxed_content(raw)
+    if inner is None:
+        return ParseResult(
+            action=None,
+            reward=error_reward,
+            obs="Invalid boxed answer: Expected \\boxed{...} with the final answer.",
+        )
 
-    except Exception as e:
+    inner = inner.strip()
+    if not inner:
         return ParseResult(
             action=None,
             reward=error_reward,
-            obs=f"Invalid boxed answer: {e}",
+            obs="Invalid boxed answer: Empty \\boxed{} content.",
         )
+
+    # Positive intrinsic reward for good formatting
+    return ParseResult(action=inner, reward=success_reward, obs=None)
@@ -1,10 +1,15 @@
 from __future__ import annotations
+import itertools
 import random
-import uuid
-from typing import List, Protocol
-from dataclasses import replace
+import secrets
+from typing import List, Optional, Protocol
+from dataclasses import fields
 from ludic.training.types import RolloutRequest
 
+# Constructor fields of RolloutRequest, resolved once instead of on every
+# dataclasses.replace() call in GRPORequestStrategy.expand.
+_REQUEST_INIT_FIELDS = tuple(f.name for f in fields(RolloutRequest) if f.init)
+
 class RequestStrategy(Protocol):
     """
     Interface for expanding a logical request (e.g., "Do task X") into
@@ -36,11 +41,25 @@ class GRPORequestStrategy:
     This ensures that when we group them later for advantage estimation (Group Normalization),
     we are comparing apples to apples (same problem, different solutions).
     """
-    def __init__(self, group_size: int):
+    def __init__(self, group_size: int, *, rng: Optional[random.Random] = None):
+        """
+        Args:
+            group_size: Number of variants (G) per base request.
+            rng: Source for env/sampling seeds of requests that do not set
+                 them. Pass a seeded `random.Random` for reproducible
+                 expansion; by default each strategy owns an unseeded one.
+                 Build the strategy once and reuse it across batches (the
+                 dataset `requests_fn` builders do) rather than per batch.
+        """
         if group_size <= 0:
             raise ValueError(f"group_size must be positive, got {group_size}")
         self.group_size = group_size
-        self._rng = random.Random()
+        self._rng = rng if rng is not None else random.Random()
+        # group_ids only need to be unique among rollouts that meet in credit
+        # assignment: a random per-strategy prefix plus a counter is enough,
+        # without an os.urandom call per group.
+        self._group_prefix = secrets.token_hex(8)
+        self._group_counter = itertools.count()
 
     def expand(self, requests: List[RolloutRequest]) -> List[RolloutRequest]:
         expanded_requests = []
@@ -62,29 +81,31 @@ class GRPORequestStrategy:
             )
 
             # 3. Generate a unique group_id for this base request's expansion.
-            group_id = str(uuid.uuid4())
-
-            # 4. Create G variants for this group.
-            for i in range(self.group_size):
-                sampling_seed = int(base_sampling_seed + i)
+            group_id = f"{self._group_prefix}-{next(self._group_counter)}"
 
-                # Merge group_id into request meta
-                new_meta = {**base_req.meta, "group_id": group_id}
-
-                # Create a copy of the request, forcing the group env seed
-                # and the diverse sampling seed.
-                new_req = replace(
-                    base_req,
-                    env_seed=group_env_seed,
-                    sampling_seed=sampling_seed,
-                    meta=new_meta,
-                    # Crucial: Each expanded request represents exactly ONE execution trace.
-                    # The original 'num_episodes' on the base request is interpreted as
-                    # "Number of groups to generate", so we effectively unroll that loop here if needed,
-                    # but typically the curriculum provides explicit request objects.
-                    # Here we assume base_req is a single intent unit.
-                    num_episodes=1,
-                )
-                expanded_requests.append(new_req)
+            # 4. Create G variants for this group. Each is a copy of the request
+            #    (like dataclasses.replace, with the field lookup done once per
+            #    group) forcing the group env seed and a diverse sampling seed.
+            req_cls = type(base_req)
+            init_fields = (
+                _REQUEST_INIT_FIELDS
+                if req_cls is RolloutRequest
+                else tuple(f.name for f in fields(req_cls) if f.init)
+            )
+            kwargs = {name: getattr(base_req, name) for name in init_fields}
+            kwargs["env_seed"] = group_env_seed
+            # Crucial: Each expanded request represents exactly ONE execution trace.
+            # The original 'num_episodes' on the base request is interpreted as
+            # "Number of groups to generate", so we effectively unroll that loop here if needed,
+            # but typically the curriculum provides explicit request objects.
+            # Here we assume base_req is a single intent unit.
+            kwargs["num_episodes"] = 1
+            base_meta = base_req.meta
+            first_seed = int(base_sampling_seed)
+            for sampling_seed in range(first_seed, first_seed + self.group_size):
+                kwargs["sampling_seed"] = sampling_seed
+                # Merge group_id into request meta (each variant owns its dict)
+                kwargs["meta"] = {**base_meta, "group_id": group_id}
+                expanded_requests.append(req_cls(**kwargs))
 
         return expanded_requests
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import queue
+import random
 from typing import Callable, Dict, List, Literal, Optional, Sequence, Tuple, TypeVar
 
 from ludic.training.types import EnvSpec, ProtocolSpec, RolloutRequest
@@ -19,6 +20,32 @@ class RequestsExhausted(RuntimeError):
     """
 
 
+def _drain_nowait(q: queue.Queue[QItem], max_items: int) -> List[QItem]:
+    """
+    Pop up to `max_items` items from `q` without blocking.
+
+    For `queue.Queue` (and its Lifo/Priority subclasses) this takes the
+    queue's mutex once and pops through the same `_qsize()`/`_get()` hooks
+    that `get_nowait()` uses, instead of locking once per item. Other
+    queue-like objects fall back to repeated `get_nowait()`.
+    """
+    if isinstance(q, queue.Queue):
+        with q.mutex:
+            take = min(max_items, q._qsize())
+            items = [q._get() for _ in range(take)]
+            if take:
+                q.not_full.notify(take)
+        return items
+
+    items: List[QItem] = []
+    for _ in range(max_items):
+        try:
+            items.append(q.get_nowait())
+        except queue.Empty:
+            break
+    return items
+
+
 def make_requests_fn_from_queue(
     q: queue.Queue[QItem],
     *,
@@ -31,18 +58,17 @@ def make_requests_fn_from_queue(
     Build a `requests_fn` that consumes items from a Queue and turns them into RolloutRequests.
 
     This is the simplest "curriculum" building block: a thread-safe queue of intent items.
+
+    Each call takes up to `batch_size` items off the queue before building any request.
+    If `build_request` raises, the whole batch is consumed and dropped, including items
+    after the failing one.
     """
     if batch_size <= 0:
         raise ValueError(f"batch_size must be positive, got {batch_size}")
 
     def _fn() -> List[RolloutRequest]:
-        reqs: List[RolloutRequest] = []
-        for _ in range(batch_size):
-            try:
-                item = q.get_nowait()
-            except queue.Empty:
-                break
-            reqs.append(build_request(item))
+        # Requests are built outside the queue lock.
+        reqs = [build_request(item) for item in _drain_nowait(q, batch_size)]
 
         if not reqs:
             if on_empty == "return_empty":
@@ -82,25 +108,9 @@ def make_dataset_queue_requests_fn(
     - wraps them into RolloutRequests
     - optionally expands requests using GRPORequestStrategy(group_size)
     """
-    env_kwargs_fn_final: Callable[[T], Dict[str, JSON]]
-    if env_kwargs_fn is None:
-        env_kwargs_fn_final = lambda sample: {"sample": sample}  # type: ignore[return-value]
-    else:
-        env_kwargs_fn_final = env_kwargs_fn
-
     protocol_kwargs_final: Dict[str, JSON] = dict(protocol_kwargs) if protocol_kwargs is not None else {}
-
-    env_seed_fn_final: Callable[[int, T], int]
-    if env_seed_fn is None:
-        env_seed_fn_final = lambda idx, _sample: idx
-    else:
-        env_seed_fn_final = env_seed_fn
-
-    sampling_seed_fn_final: Callable[[int, T], int]
-    if sampling_seed_fn is None:
-        sampling_seed_fn_final = lambda idx, _sample: idx
-    else:
-        sampling_seed_fn_final = sampling_seed_fn
+    # One spec shared by every request; treat it as read-only.
+    protocol_spec = ProtocolSpec(kind=protocol_kind, kwargs=protocol_kwargs_final)
 
     meta_fn = request_meta_fn
 
@@ -113,12 +123,16 @@ def make_dataset_queue_requests_fn(
         meta: Dict[str, JSON] = {}
         if meta_fn is not None:
             meta = dict(meta_fn(idx, sample))
+        # Default: seeds = idx, env kwargs = {"sample": sample}.
+        env_kwargs = {"sample": sample} if env_kwargs_fn is None else env_kwargs_fn(sample)
+        env_seed = int(idx if env_seed_fn is None else env_seed_fn(idx, sample))
+        sampling_seed = int(idx if sampling_seed_fn is None else sampling_seed_fn(idx, sample))
         return RolloutRequest(
-            env=EnvSpec(kind=env_kind, kwargs=env_kwargs_fn_final(sample)),
-            protocol=ProtocolSpec(kind=protocol_kind, kwargs=protocol_kwargs_final),
+            env=EnvSpec(kind=env_kind, kwargs=env_kwargs),
+            protocol=protocol_spec,
             num_episodes=1,
-            env_seed=int(env_seed_fn_final(idx, sample)),
-            sampling_seed=int(sampling_seed_fn_final(idx, sample)),
+            env_seed=env_seed,
+            sampling_seed=sampling_seed,
             inference=inference,
             meta=meta,
         )
@@ -154,8 +168,6 @@ def make_dataset_sequence_requests_fn(
     - If shuffle=True, samples are visited in a pseudo-random order (deterministic via rng_seed).
     - Once exhausted, it loops forever (research scaffolding default); wrap your own if you want a stop condition.
     """
-    import random
-
     if not samples:
         raise ValueError("samples must be non-empty")
 
@@ -165,25 +177,9 @@ def make_dataset_sequence_requests_fn(
         rng.shuffle(order)
     pos = 0
 
-    env_kwargs_fn_final: Callable[[T], Dict[str, JSON]]
-    if env_kwargs_fn is None:
-        env_kwargs_fn_final = lambda sample: {"sample": sample}  # type: ignore[return-value]
-    else:
-        env_kwargs_fn_final = env_kwargs_fn
-
     protocol_kwargs_final: Dict[str, JSON] = dict(protocol_kwargs) if protocol_kwargs is not None else {}
-
-    env_seed_fn_final: Callable[[int, T], int]
-    if env_seed_fn is None:
-        env_seed_fn_final = lambda idx, _sample: idx
-    else:
-        env_seed_fn_final = env_seed_fn
-
-    sampling_seed_fn_final: Callable[[int, T], int]
-    if sampling_seed_fn is None:
-        sampling_seed_fn_final = lambda idx, _sample: idx
-    else:
-        sampling_seed_fn_final = sampling_seed_fn
+    # One spec shared by every request; treat it as read-only.
+    protocol_spec = ProtocolSpec(kind=protocol_kind, kwargs=protocol_kwargs_final)
 
     meta_fn = request_meta_fn
 
@@ -192,13 +188,16 @@ def make_dataset_sequence_requests_fn(
         strategy = GRPORequestStrategy(group_size=group_size)
 
     def _fn() -> List[RolloutRequest]:
-        nonlocal pos, order
+        nonlocal pos
         reqs: List[RolloutRequest] = []
         for _ in range(batch_size):
             if pos >= len(order):
                 pos = 0
-                order = list(range(len(samples)))
+                # Without shuffle the order never changes. With shuffle, refill
+                # in place from the identity order so the sequence of epochs
+                # stays the same for a given rng_seed.
                 if shuffle:
+                    order[:] = range(len(samples))
                     rng.shuffle(order)
             idx = order[pos]
             pos += 1
@@ -206,13 +205,17 @@ def make_dataset_sequence_requests_fn(
             meta: Dict[str, JSON] = {}
             if meta_fn is not None:
                 meta = dict(meta_fn(idx, sample))
+            # Default: seeds = idx, env kwargs = {"sample": sample}.
+            env_kwargs = {"sample": sample} if env_kwargs_fn is None else env_kwargs_fn(sample)
+            env_seed = int(idx if env_seed_fn is None else env_seed_fn(idx, sample))
+            sampling_seed = int(idx if sampling_seed_fn is None else sampling_seed_fn(idx, sample))
             reqs.append(
                 RolloutRequest(
-                    env=EnvSpec(kind=env_kind, kwargs=env_kwargs_fn_final(sample)),
-                    protocol=ProtocolSpec(kind=protocol_kind, kwargs=protocol_kwargs_final),
+                    env=EnvSpec(kind=env_kind, kwargs=env_kwargs),
+                    protocol=protocol_spec,
                     num_episodes=1,
-                    env_seed=int(env_seed_fn_final(idx, sample)),
-                    sampling_seed=int(sampling_seed_fn_final(idx, sample)),
+                    env_seed=env_seed,
+                    sampling_seed=sampling_seed,
                     inference=inference,
                     meta=meta,
                 )
@@ -57,6 +57,15 @@ def default_step_selector(step: Step) -> bool:
     return False
 
 
+def _flatten(filters: Sequence[SampleFilter], attr: str) -> tuple[SampleFilter, ...]:
+    # Inline the children of nested combine()/any_of() filters of the same
+    # kind, so deep combinations run as one loop instead of a closure chain.
+    flat: list[SampleFilter] = []
+    for f in filters:
+        flat.extend(getattr(f, attr, (f,)))
+    return tuple(flat)
+
+
 def combine(*filters: SampleFilter) -> SampleFilter:
     """
     Combine multiple filters with AND logic.
@@ -67,8 +76,15 @@ def combine(*filters: SampleFilter) -> SampleFilter:
         combined = combine(drop_truncated, drop_incomplete_completions)
         filtered_items = [item for item in items if combined(item)]
     """
+    flat = _flatten(filters, "_and_filters")
+
     def combined_filter(item: SAWItem) -> bool:
-        return all(f(item) for f in filters)
+        for f in flat:
+            if not f(item):
+                return False
+        return True
+
+    combined_filter._and_filters = flat  # type: ignore[attr-defined]
     return combined_filter
 
 
@@ -78,8 +94,15 @@ def any_of(*filters: SampleFilter) -> SampleFilter:
 
     A sample is kept if ANY filter returns True.
     """
+    flat = _flatten(filters, "_or_filters")
+
     def or_filter(item: SAWItem) -> bool:
-        return any(f(item) for f in filters)
+        for f in flat:
+            if f(item):
+                return True
+        return False
+
+    or_filter._or_filters = flat  # type: ignore[attr-defined]
     return or_filter
 
 
@@ -52,20 +52,53 @@ def default_reducers() -> Mapping[str, Reducer]:
     }
 
 
-def _get_value_from_source(item: SAWItem, source: str | Callable[[SAWItem], object]) -> object:
-    if callable(source):
-        return source(item)
-    # Treat strings as dotted paths into item.meta
-    current: object = item.meta
-    for part in source.split("."):
-        if not isinstance(current, dict) or part not in current:
-            return None
-        current = current[part]
-    return current
+def _compile_path(source: str) -> Callable[[object], object]:
+    """
+    Compile a dotted path ("a.b.c") into a resolver over nested dicts.
+
+    The resolver returns None if any part is missing (or a non-dict is hit).
+    Compiled once per reducer so records don't re-split the path.
+    """
+    keys = tuple(source.split("."))
+    if len(keys) == 1:
+        key = keys[0]
+
+        def _get(root: object) -> object:
+            return root.get(key) if isinstance(root, dict) else None
+
+        return _get
+
+    def _walk(root: object) -> object:
+        for key in keys:
+            if not isinstance(root, dict) or key not in root:
+                return None
+            root = root[key]
+        return root
+
+    return _walk
 
 
-def _apply_transform(value: object, transform: Optional[Callable[[object], object]]) -> object:
-    return transform(value) if transform else value
+def _column_values(column: List[object], transform: Optional[Callable[[object], object]]) -> List[object]:
+    """Drop missing (None) values from a column and apply the optional transform."""
+    if transform is None:
+        return [v for v in column if v is not None]
+    return [transform(v) for v in column if v is not None]
+
+
+def _reduce_values(kind: ReducerKind, values: List[object]) -> float:
+    """
+    Reduce one reducer's column of (transformed, non-missing) values.
+
+    The column is reduced with builtins over `map` rather than per-value
+    generator expressions, so the loop itself runs in C.
+    """
+    if kind == "mean":
+        return float(sum(map(float, values)) / len(values)) if values else 0.0
+    if kind == "sum":
+        return float(sum(map(float, values)))
+    if kind == "count_true":
+        return float(sum(map(bool, values)))
+    raise ValueError(f"Unknown reducer kind: {kind}")
 
 
 def aggregate_stats(
@@ -193,23 +226,15 @@ def aggregate_stats(
         items: List[SAWItem] = [item for batch in saw_batches for item in batch.items]
 
         for name, reducer in reducers.items():
-            values: List[object] = []
-            for item in items:
-                raw = _get_value_from_source(item, reducer.source)
-                if raw is None:
-                    continue
-                values.append(_apply_transform(raw, reducer.transform))
-
-            result: float = 0.0
-            if reducer.kind == "mean":
-                if values:
-                    result = float(sum(float(v) for v in values) / len(values))
-            elif reducer.kind == "sum":
-                result = float(sum(float(v) for v in values))
-            elif reducer.kind == "count_true":
-                result = float(sum(1.0 for v in values if bool(v)))
+            # Extract this reducer's column in one pass, then reduce it.
+            # String sources are dotted paths into item.meta.
+            source = reducer.source
+            if callable(source):
+                column = [source(item) for item in items]
             else:
-                raise ValueError(f"Unknown reducer kind: {reducer.kind}")
+                get = _compile_path(source)
+                column = [get(item.meta) for item in items]
+            result = _reduce_values(reducer.kind, _column_values(column, reducer.transform))
 
             if reducer.normalize_by == "samples":
                 denom = total_samples
@@ -249,30 +274,11 @@ def apply_reducers_to_records(
 
     out: Dict[str, float] = {}
     for name, reducer in reducers.items():
-        values: List[object] = []
-        for rec in items:
-            raw = rec
-            for part in reducer.source.split(".") if isinstance(reducer.source, str) else []:
-                if not isinstance(raw, dict) or part not in raw:
-                    raw = None
-                    break
-                raw = raw[part]
-            if callable(reducer.source):
-                raw = reducer.source(rec)  # type: ignore[arg-type]
-            if raw is None:
-                continue
-            values.append(_apply_transform(raw, reducer.transform))
-
-        result: float = 0.0
-        if reducer.kind == "mean":
-            if values:
-                result = float(sum(float(v) for v in values) / len(values))
-        elif reducer.kind == "sum":
-            result = float(sum(float(v) for v in values))
-        elif reducer.kind == "count_true":
-            result = float(sum(1.0 for v in values if bool(v)))
-        else:
-            raise ValueError(f"Unknown reducer kind: {reducer.kind}")
+        # Extract this reducer's column in one pass, then reduce it.
+        source = reducer.source
+        get = source if callable(source) else _compile_path(source)
+        column = [get(rec) for rec in items]
+        result = _reduce_values(reducer.kind, _column_values(column, reducer.transform))
 
         if reducer.normalize_by == "samples":
             denom = totals["samples"]
@@ -1,6 +1,6 @@
 import pytest
 
-from ludic.envs.dataset_qa_env import DatasetQAEnv
+from ludic.envs.dataset_qa_env import BatchDatasetQAEnv, DatasetQAEnv
 
 
 def test_dataset_env_runs_one_step_and_grades_correctly():
@@ -51,3 +51,115 @@ def test_sequential_sampling_without_shuffle():
     obs2, _ = env.reset()["agent_0"]
     assert obs1 == "Q1"
     assert obs2 == "Q1"
+
+
+def test_target_parser_runs_once_per_env():
+    calls: list[str] = []
+
+    def counting_parser(text: str) -> str:
+        calls.append(text)
+        return text.strip()
+
+    env = DatasetQAEnv({"question": "Q", "answer": " a "}, target_parser=counting_parser)
+    env.reset(seed=0)
+    assert calls == [" a "]
+
+    outcome = env.step({"agent_0": "a"})["agent_0"]
+    assert outcome.info["target_answer"] == "a"
+    assert calls == [" a "]
+
+    env.reset(seed=1)
+    assert env.step({"agent_0": "a"})["agent_0"].info["correct"] is True
+    assert calls == [" a "]
+
+
+def test_missing_prompt_key_raises_on_reset():
+    env = DatasetQAEnv({"answer": "a"})
+    with pytest.raises(KeyError):
+        env.reset(seed=0)
+
+
+def test_default_verifier_is_case_and_whitespace_insensitive():
+    env = DatasetQAEnv({"question": "Capital of France?", "answer": " Paris "})
+
+    env.reset(seed=0)
+    assert env.step({"agent_0": "  pARIS\n"})["agent_0"].info["correct"] is True
+
+    env.reset(seed=0)
+    assert env.step({"agent_0": "Lyon"})["agent_0"].info["correct"] is False
+
+
+def test_custom_verifier_still_receives_parsed_target():
+    seen: list[tuple[str, str]] = []
+
+    def exact(a: str, b: str) -> bool:
+        seen.append((a, b))
+        return a == b
+
+    env = DatasetQAEnv({"question": "Q", "answer": "Yes"}, verifier=exact)
+    env.reset(seed=0)
+    outcome = env.step({"agent_0": "yes"})["agent_0"]
+
+    assert seen == [("yes", "Yes")]
+    assert outcome.info["correct"] is False
+
+
+def test_batch_env_grades_aligned_with_samples():
+    samples = [
+        {"id": "q1", "question": "1+1?", "answer": "2"},
+        {"id": "q2", "question": "Capital of France?", "answer": "Paris"},
+        {"id": "q3", "question": "2+2?", "answer": "4"},
+    ]
+    env = BatchDatasetQAEnv(samples)
+
+    prompts, infos = env.env_reset(seed=0)
+    assert prompts == ["1+1?", "Capital of France?", "2+2?"]
+    assert [i["question_id"] for i in infos] == ["q1", "q2", "q3"]
+
+    outcomes = env.env_step(["2", " paris ", None])
+    assert [o.info["correct"] for o in outcomes[:2]] == [True, True]
+    assert outcomes[2] is None
+    assert env.active_agents == ["agent_2"]
+
+    outcome = env.env_step([None, None, "5"])[2]
+    assert outcome.info["correct"] is False
+    assert outcome.reward == pytest.approx(0.0)
+    assert env.active_agents == []
+
+
+def test_batch_env_rejected_step_leaves_state_unchanged():
+    env = BatchDatasetQAEnv([{"question": "Q1", "answer": "1"}, {"question": "Q2", "answer": "2"}])
+    env.reset(seed=0)
+    env.env_step([None, "2"])
+    active, obs = env.active_agents, env.current_obs()
+
+    with pytest.raises(RuntimeError):
+        env.env_step(["1", "2"])
+
+    assert env.active_agents == active == ["agent_0"]
+    assert env.current_obs() == obs
+    assert env.env_step(["1", None])[0].info["correct"] is True
+
+def test_batch_env_matches_single_env_through_dict_api():
+    samples = [{"question": "Q1", "answer": "\\boxed{7}"}, {"question": "Q2", "answer": "x"}]
+    parser = lambda t: t.replace("\\boxed{", "").replace("}", "").strip()  # noqa: E731
+    env = BatchDatasetQAEnv(samples, target_parser=parser, correct_reward=2.0)
+
+    obs = env.reset(seed=0)
+    assert obs["agent_0"][0] == "Q1"
+
+    out = env.step({"agent_0": "7", "agent_1": "y"})
+    single = DatasetQAEnv(samples[0], target_parser=parser, correct_reward=2.0)
+    single.reset(seed=0)
+    expected = single.step({"agent_0": "7"})["agent_0"]
+
+    assert out["agent_0"] == expected
+    assert out["agent_1"].info["correct"] is False
+
+    with pytest.raises(RuntimeError):
+        env.step({"agent_0": "7"})
+
+
+def test_dataset_envs_are_slotted():
+    assert not hasattr(DatasetQAEnv({"question": "Q", "answer": "a"}), "__dict__")
+    assert not hasattr(BatchDatasetQAEnv([{"question": "Q", "answer": "a"}]), "__dict__")
@@ -1,4 +1,5 @@
 from functools import partial
+import re
 
 import pytest
 
@@ -6,9 +7,11 @@ from ludic.parsers import (
     ParseResult,
     think_prefix_parser,
     boxed_parser,
+    extract_last_boxed_content,
     xml_tag_parser,
     xml_parser,
     compose_parsers,
+    _compile_xml,
 )
 
 
@@ -147,6 +150,35 @@ def test_xml_parser_rejects_unknown_kind():
         xml_parser("move", kind="nope")  # type: ignore[arg-type]
 
 
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "<think>a</think> b",
+        "<think>a<b>c</think>d</think>e",
+        "<THINK>x</think>\n\n y",
+        "<think>a</think>   ",
+        "<think>a</thin",
+        "pre <think>a < /think></think>",
+        "<think><think></think>z",
+        "<think>" + "word " * 1000,
+    ],
+)
+def test_xml_patterns_match_lazy_reference(raw):
+    # The negated-class tag body must stop at the same (first) closing tag
+    # as the original lazy `.*?` patterns.
+    flags = re.DOTALL | re.IGNORECASE
+    inner_ref = re.compile(r"<think>(.*?)</think>", flags)
+    prefix_ref = re.compile(r"^\s*<think>(.*?)</think>\s*(.+)$", flags)
+    inner, _ = _compile_xml("think", False, "inner")
+    prefix, _ = _compile_xml("think", False, "remainder_after_prefix")
+
+    def groups(m):
+        return m.groups() if m else None
+
+    assert groups(inner.search(raw)) == groups(inner_ref.search(raw))
+    assert groups(prefix.match(raw)) == groups(prefix_ref.match(raw))
+
+
 # ---------------------------------------------------------------------
 # xml_tag_parser(exact=True) tests
 # ---------------------------------------------------------------------
@@ -276,3 +308,17 @@ def test_boxed_parser_fails_without_box():
     r = boxed_parser("no box here")
     assert r.action is None
     assert r.reward < 0.0
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("\\boxed {7}", "7"),
+        ("\\boxed\n{\\{x\\}}", "\\{x\\}"),
+        ("\\boxed{1} then \\boxed{2", "1"),
+        ("\\boxed{\\boxed{3}}", "3"),
+        ("\\boxed x {4}", None),
+    ],
+)
+def test_extract_last_boxed_content_edge_cases(raw, expected):
+    assert extract_last_boxed_content(raw) == expected
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import queue
+import random
 
 import pytest
 
 from ludic.training import (
+    EnvSpec,
+    GRPORequestStrategy,
+    ProtocolSpec,
     RequestsExhausted,
+    RolloutRequest,
     make_dataset_queue_requests_fn,
     make_requests_fn_from_queue,
 )
@@ -88,3 +93,42 @@ def test_make_dataset_queue_requests_fn_group_expands_sampling_seeds() -> None:
     assert len(reqs) == 3
     assert {r.env_seed for r in reqs} == {0}
     assert [r.sampling_seed for r in reqs] == [100, 101, 102]
+
+
+@pytest.mark.parametrize("queue_cls", [queue.Queue, queue.LifoQueue, queue.PriorityQueue])
+def test_make_requests_fn_from_queue_drains_in_get_order(queue_cls) -> None:
+    q = queue_cls(maxsize=5)
+    for item in [3, 1, 4, 2, 5]:
+        q.put(item)
+    expected = [q.get_nowait() for _ in range(5)]
+    for item in [3, 1, 4, 2, 5]:
+        q.put(item)
+
+    fn = make_requests_fn_from_queue(
+        q,
+        batch_size=3,
+        build_request=lambda x: x,  # type: ignore[arg-type]
+        on_empty="return_empty",
+    )
+
+    assert fn() == expected[:3]
+    # Freed slots are visible to producers on a bounded queue.
+    q.put_nowait(9)
+    assert sorted(fn()) == sorted(expected[3:] + [9])
+    assert fn() == []
+
+
+def test_grpo_strategy_seeded_rng_is_reproducible() -> None:
+    base = RolloutRequest(
+        env=EnvSpec(kind="gsm8k"),
+        protocol=ProtocolSpec(kind="single_agent"),
+    )
+
+    def expand(seed: int) -> list[tuple[int | None, int | None]]:
+        strategy = GRPORequestStrategy(group_size=2, rng=random.Random(seed))
+        return [(r.env_seed, r.sampling_seed) for r in strategy.expand([base, base])]
+
+    first = expand(123)
+    assert first == expand(123)
+    assert first[0][0] == first[1][0]  # group shares its env seed
+    assert first[1][1] == first[0][1] + 1
@@ -73,3 +73,26 @@ def test_apply_filter() -> None:
     kept = apply_filter(items, drop_truncated)
     assert [i.meta["step"] for i in kept] == [0, 2]
 
+
+def test_nested_combinations_flatten_and_keep_semantics() -> None:
+    calls: list[str] = []
+
+    def spy(name: str, result: bool):
+        def f(_item: SAWItem) -> bool:
+            calls.append(name)
+            return result
+        return f
+
+    nested_and = combine(combine(spy("a", True), spy("b", False)), spy("c", True))
+    assert nested_and(_item()) is False
+    assert calls == ["a", "b"]  # short-circuits like a flat combine
+
+    calls.clear()
+    nested_or = any_of(spy("d", False), any_of(spy("e", True), spy("f", True)))
+    assert nested_or(_item()) is True
+    assert calls == ["d", "e"]
+
+    assert combine()(_item()) is True
+    assert any_of()(_item()) is False
+    # Mixed nesting is not flattened across AND/OR.
+    assert combine(any_of(drop_truncated, drop_parse_errors), keep_all)(_item(truncated=True)) is True
@@ -1,4 +1,8 @@
-from ludic.context.truncated_thinking import TruncatedThinkingContext
+import re
+
+import pytest
+
+from ludic.context.truncated_thinking import TruncatedThinkingContext, _split_think_prefix
 
 def test_truncates_valid_format():
     """
@@ -126,4 +130,106 @@ def test_multiple_think_blocks():
     # it matches the first block. The rest (`<think>Second...`) becomes part of the "Answer" group.
     # This is acceptable behavior for a "Prefix Truncator".
     expected = "<think>[GONE]</think> <think>Second thought</think> Answer"
-    assert view[0]["content"] == expected
\ No newline at end of file
+    assert view[0]["content"] == expected
+
+def test_prefix_check_is_whitespace_and_case_insensitive():
+    """The cheap pre-regex check must not change which messages get truncated."""
+    ctx = TruncatedThinkingContext(placeholder="[GONE]")
+
+    ctx._messages.extend([
+        {"role": "assistant", "content": "\n\t  <think>indented</think> A1"},
+        {"role": "assistant", "content": "<THINK>shouting</THINK> A2"},
+        {"role": "assistant", "content": "Plain answer, no thoughts."},
+        {"role": "assistant", "content": "   leading spaces but no tag"},
+    ])
+    view = ctx.on_before_act()
+
+    assert view[0]["content"] == "\n\t  <think>[GONE]</think> A1"
+    assert view[1]["content"] == "<THINK>[GONE]</THINK> A2"
+    assert view[2] is ctx._messages[2]
+    assert view[3] is ctx._messages[3]
+
+
+def test_incremental_view_matches_full_rebuild():
+    """Only new messages are sanitized per call; the view stays correct."""
+    ctx = TruncatedThinkingContext(placeholder="[GONE]")
+    ctx._messages.append({"role": "assistant", "content": "<think>never closed"})
+    ctx._messages.append({"role": "assistant", "content": "<think>x</think> A"})
+
+    first = ctx.on_before_act()
+    assert ctx._sanitized_upto == 2
+
+    ctx._messages.append({"role": "user", "content": "next"})
+    ctx._messages.append({"role": "assistant", "content": "<think>y</think> B"})
+    second = ctx.on_before_act()
+
+    assert second[:2] == first
+    assert [m["content"] for m in second] == [
+        "<think>never closed",
+        "<think>[GONE]</think> A",
+        "next",
+        "<think>[GONE]</think> B",
+    ]
+
+    # The returned list is a snapshot, not the internal cache.
+    second.append({"role": "user", "content": "scratch"})
+    assert len(ctx.on_before_act()) == 4
+
+    ctx.placeholder = "[X]"
+    assert ctx.on_before_act()[1]["content"] == "<think>[X]</think> A"
+
+
+def test_reset_invalidates_sanitized_view():
+    ctx = TruncatedThinkingContext(system_prompt="sys", placeholder="[GONE]")
+    ctx._messages.append({"role": "assistant", "content": "<think>x</think> A"})
+    assert len(ctx.on_before_act()) == 2
+
+    ctx.reset()
+    view = ctx.on_before_act()
+    assert view == [{"role": "system", "content": "sys"}]
+
+
+def test_no_think_history_is_not_duplicated():
+    """Without any rewrite the view is a plain copy of the transcript."""
+    ctx = TruncatedThinkingContext(system_prompt="sys")
+    ctx._messages.append({"role": "user", "content": "hi"})
+    ctx._messages.append({"role": "assistant", "content": "hello"})
+
+    view = ctx.on_before_act()
+    assert view == ctx._messages
+    assert view is not ctx._messages
+    assert ctx._sanitized is None
+
+    ctx._messages.append({"role": "assistant", "content": "<think>t</think> A"})
+    view = ctx.on_before_act()
+    assert [m["content"] for m in view] == ["sys", "hi", "hello", "<think>[TRUNCATED]</think> A"]
+    assert view[1] is ctx._messages[1]
+
+
+_REFERENCE_PATTERN = re.compile(
+    r"^(\s*<think>)(.*?)(</think>\s*)(.+)$", flags=re.DOTALL | re.IGNORECASE
+)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "<think>a</think> b",
+        "<think>a</think>",
+        "<think>a</think>   ",
+        "<think>a</think> \n",
+        "  <Think>a</THINK>b</think>",
+        "<think>a<think>b</think>c",
+        "<think></think>x",
+        "<think>never closed",
+        "<think>a</thinking> b",
+        "\t<think>\n</think>\n\nans\n",
+        "x<think>a</think> b",
+        "",
+        "   ",
+    ],
+)
+def test_split_matches_reference_regex(content):
+    m = _REFERENCE_PATTERN.match(content)
+    expected = (m.group(1), m.group(3), m.group(4)) if m else None
+    assert _split_think_prefix(content) == expected